@@ -6,6 +6,9 @@ Platform-agnostic AI development agents for cloud platforms.
 
 __version__ = "0.1.0"
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .common.models import (
     KiroAgentInterface,
     KiroRequest,
@@ -13,9 +16,19 @@ from .common.models import (
     KiroMetrics,
     KiroAgentFactory,
 )
-from .cloudrun.agent import CloudRunKiroAgent
-from .gke.agent import GKEKiroAgent
-from .cloud_functions.agent import CloudFunctionsKiroAgent
+
+if TYPE_CHECKING:
+    from .cloudrun.agent import CloudRunKiroAgent
+    from .gke.agent import GKEKiroAgent
+    from .cloud_functions.agent import CloudFunctionsKiroAgent
+
+# Platform agents are imported on first access (PEP 562) so that e.g. a
+# Cloud Functions deployment does not pay for importing FastAPI/Uvicorn.
+_LAZY_AGENTS = {
+    "CloudRunKiroAgent": ".cloudrun.agent",
+    "GKEKiroAgent": ".gke.agent",
+    "CloudFunctionsKiroAgent": ".cloud_functions.agent",
+}
 
 __all__ = [
     "KiroAgentInterface",
@@ -28,3 +41,15 @@ __all__ = [
     "CloudFunctionsKiroAgent",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    """Import platform agents lazily on first attribute access"""
+    if name in _LAZY_AGENTS:
+        agent_cls = getattr(import_module(_LAZY_AGENTS[name], __name__), name)
+        globals()[name] = agent_cls
+        return agent_cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
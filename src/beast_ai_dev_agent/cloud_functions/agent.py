@@ -4,50 +4,72 @@ Platform-specific implementation for Google Cloud Functions
 """
 
 import logging
+import time
+from types import MappingProxyType
 from typing import Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 
 from ..common.models import KiroAgentInterface, KiroRequest, KiroResponse
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Response headers are identical for every request - share one read-only mapping
+_HDR_OK = MappingProxyType({"X-Platform": "cloud_functions"})
+_HDR_ERR = _HDR_OK
+
+# Body returned to the warm-up ping {"warmup": true}
+_WARMUP_DATA: Dict[str, Any] = {"warm": True, "platform": "cloud_functions"}
+
 
 class CloudFunctionsKiroAgent(KiroAgentInterface):
     """Cloud Functions specific implementation - optimized for serverless"""
 
     def __init__(self):
+        # The agent is constructed once per instance at function load, so this
+        # is the Cloud Functions entry point for logging configuration
+        logging.basicConfig(level=logging.INFO)
         super().__init__(platform="cloud_functions")
         logger.info("CloudFunctionsKiroAgent initialized (serverless)")
 
     def process_request(self, request: KiroRequest) -> KiroResponse:
         """Process request with minimal overhead for cold starts"""
+        # Warm-up pings ({"warmup": true} exactly) only need the instance
+        # loaded - skip analysis and metrics
+        data = request.data
+        if isinstance(data, dict) and len(data) == 1 and data.get("warmup") is True:
+            return KiroResponse(
+                data=dict(_WARMUP_DATA),
+                status_code=200,
+                headers=_HDR_OK,
+                timestamp=datetime.now(timezone.utc).isoformat(),
+            )
+
         try:
-            self.request_count += 1
-            start_time = datetime.utcnow()
+            self._record_request()
+            t0 = time.perf_counter_ns()
 
             # Perform analysis
-            result = self.analyze_data(request.data)
+            result = self.analyze_data(request.data, request.body_size)
 
             # Calculate response time
-            response_time = (datetime.utcnow() - start_time).total_seconds()
-            self.response_times.append(response_time)
+            response_time = (time.perf_counter_ns() - t0) / 1e9
+            self._record_response_time(response_time)
 
             return KiroResponse(
                 data=result,
                 status_code=200,
-                headers={"X-Platform": "cloud_functions"},
-                timestamp=datetime.utcnow().isoformat(),
+                headers=_HDR_OK,
+                timestamp=datetime.now(timezone.utc).isoformat(),
             )
 
         except Exception as e:
-            self.error_count += 1
+            self._record_error()
             logger.error(f"Error in Cloud Function: {e}")
             return KiroResponse(
                 data={"error": str(e)},
                 status_code=500,
-                headers={"X-Platform": "cloud_functions"},
-                timestamp=datetime.utcnow().isoformat(),
+                headers=_HDR_ERR,
+                timestamp=datetime.now(timezone.utc).isoformat(),
             )
 
     def health_check(self) -> Dict[str, Any]:
@@ -64,6 +86,8 @@ class CloudFunctionsKiroAgent(KiroAgentInterface):
 
         return KiroMetrics(
             platform="cloud_functions",
+            instance_id=self.instance_id,
+            timestamp=datetime.now(timezone.utc).isoformat(),
             request_count=self.request_count,
             error_count=self.error_count,
             avg_response_time=0.0,
@@ -3,14 +3,39 @@ Cloud Run Kiro Agent Implementation
 Platform-specific implementation for Google Cloud Run
 """
 
+import asyncio
+import json
 import logging
 import os
-from typing import Dict, Any
-from datetime import datetime
+import time
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Union
+from datetime import datetime, timezone
 
 from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
+import orjson
 import uvicorn
+from pydantic import RootModel, ValidationError
+
+try:
+    import uvloop  # noqa: F401
+
+    _UVICORN_LOOP = "uvloop"
+except ImportError:  # uvloop is unavailable on Windows
+    _UVICORN_LOOP = "asyncio"
+
+try:
+    import httptools  # noqa: F401
+
+    _UVICORN_HTTP = "httptools"
+except ImportError:
+    _UVICORN_HTTP = "h11"
+
+try:
+    import psutil
+except ImportError:  # resource metrics are optional
+    psutil = None
 
 from ..common.models import (
     KiroAgentInterface,
@@ -19,19 +44,61 @@ from ..common.models import (
     KiroMetrics,
 )
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# How long an encoded /health payload is reused before being rebuilt
+HEALTH_CACHE_TTL_NS = 1_000_000_000
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, falling back to stdlib json"""
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(content)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which stdlib json still accepts
+            return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class AnalyzeBody(RootModel[Dict[str, Any]]):
+    """Request body for /analyze - any JSON object"""
+
 
 class CloudRunKiroAgent(KiroAgentInterface):
     """Cloud Run specific implementation of Kiro Agent"""
 
-    def __init__(self):
-        super().__init__(platform="cloudrun")
-        self.app = FastAPI(title="Cloud Run Kiro Agent", version="0.1.0")
+    CAPABILITIES = ("auto_scaling", "pay_per_use", "serverless", "http_triggers", "event_triggers")
+    CONSTRAINTS = ("15_minute_timeout", "http_only", "stateless_only", "ephemeral_storage")
+
+    def __init__(self, platform: str = "cloudrun", title: str = "Cloud Run Kiro Agent"):
+        super().__init__(platform=platform)
+        self.title = title
+        self._headers = MappingProxyType({"X-Platform": platform})
+        self._beast_mode = os.getenv("BEAST_MODE_ENABLED", "false").lower() == "true"
+        self._emit_timing_headers = os.getenv("EMIT_TIMING_HEADERS", "false").lower() == "true"
+        self.app = FastAPI(
+            title=title,
+            version="0.1.0",
+            default_response_class=ORJSONResponse,
+        )
         self._setup_routes()
+        self._root_bytes = orjson.dumps(
+            {
+                "service": title,
+                "platform": platform,
+                "version": "0.1.0",
+                "status": "running",
+            }
+        )
+        self._health_bytes = b""
+        self._health_expires_ns = 0
+        self._proc = psutil.Process() if psutil is not None else None
+        if psutil is not None:
+            # Prime the CPU sampler so later non-blocking calls have a baseline
+            psutil.cpu_percent(interval=None)
         self.port = int(os.getenv("PORT", "8080"))
-        logger.info(f"CloudRunKiroAgent initialized on port {self.port}")
+        logger.info(f"{type(self).__name__} initialized on port {self.port}")
 
     def _setup_routes(self):
         """Setup FastAPI routes"""
@@ -54,55 +121,63 @@ class CloudRunKiroAgent(KiroAgentInterface):
         @self.app.get("/")
         async def root():
             """Root endpoint"""
-            return {
-                "service": "Cloud Run Kiro Agent",
-                "platform": "cloudrun",
-                "version": "0.1.0",
-                "status": "running",
-            }
+            return Response(content=self._root_bytes, media_type="application/json")
 
     async def _health_check_handler(self):
-        """Handle health check requests"""
-        health_data = self.health_check()
-        return JSONResponse(content=health_data, status_code=200)
+        """Handle health check requests, reusing the encoded payload for a short TTL"""
+        now = time.monotonic_ns()
+        if now >= self._health_expires_ns:
+            self._health_bytes = orjson.dumps(self.health_check())
+            self._health_expires_ns = now + HEALTH_CACHE_TTL_NS
+        return Response(content=self._health_bytes, status_code=200, media_type="application/json")
 
     async def _analyze_handler(self, request: Request):
         """Handle analysis requests"""
         try:
-            # Parse request body
-            body = await request.json()
+            # Parse and validate request body in one pass (pydantic-core)
+            body = await request.body()
+            data = AnalyzeBody.model_validate_json(body).root
 
             # Create KiroRequest
             kiro_request = KiroRequest(
-                data=body,
-                headers=dict(request.headers),
+                data=data,
+                headers=request.headers,
                 method=request.method,
-                path=str(request.url.path),
-                query_params=dict(request.query_params),
-                timestamp=datetime.utcnow().isoformat(),
+                path=request.url.path,
+                query_params=request.query_params,
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                body_size=len(body),
             )
 
-            # Process request
-            kiro_response = self.process_request(kiro_request)
+            # Process request off the event loop thread
+            kiro_response = await asyncio.to_thread(self.process_request, kiro_request)
 
             # Return response
-            return JSONResponse(
+            return ORJSONResponse(
                 content=kiro_response.data, status_code=kiro_response.status_code
             )
 
+        except ValidationError as e:
+            return ORJSONResponse(
+                content={"error": str(e), "platform": self.platform},
+                status_code=422,
+            )
+
         except Exception as e:
             logger.error(f"Error processing analyze request: {e}")
-            return JSONResponse(
-                content={"error": str(e), "platform": "cloudrun"},
+            return ORJSONResponse(
+                content={"error": str(e), "platform": self.platform},
                 status_code=500,
             )
 
     async def _metrics_handler(self):
         """Handle metrics requests"""
         metrics = self.get_metrics()
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "platform": metrics.platform,
+                "instance_id": metrics.instance_id,
+                "timestamp": metrics.timestamp,
                 "request_count": metrics.request_count,
                 "error_count": metrics.error_count,
                 "avg_response_time": metrics.avg_response_time,
@@ -114,44 +189,49 @@ class CloudRunKiroAgent(KiroAgentInterface):
     def process_request(self, request: KiroRequest) -> KiroResponse:
         """Process a Kiro agent request on Cloud Run"""
         try:
-            self.request_count += 1
-            start_time = datetime.utcnow()
+            self._record_request()
+            t0 = time.perf_counter_ns()
 
             # Perform analysis using parent class method
-            result = self.analyze_data(request.data)
+            result = self.analyze_data(request.data, request.body_size)
 
             # Calculate response time
-            end_time = datetime.utcnow()
-            response_time = (end_time - start_time).total_seconds()
-            self.response_times.append(response_time)
+            response_time = (time.perf_counter_ns() - t0) / 1e9
+            self._record_response_time(response_time)
 
             # Create response
+            headers: Mapping[str, str]
+            if self._emit_timing_headers:
+                headers = {**self._headers, "X-Response-Time": f"{response_time:.6f}"}
+            else:
+                headers = self._headers
             response = KiroResponse(
                 data=result,
                 status_code=200,
-                headers={"X-Platform": "cloudrun", "X-Response-Time": str(response_time)},
-                timestamp=end_time.isoformat(),
+                headers=headers,
+                timestamp=datetime.now(timezone.utc).isoformat(),
             )
 
-            logger.info(f"Request processed successfully in {response_time}s")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Request processed successfully in %ss", response_time)
             return response
 
         except Exception as e:
-            self.error_count += 1
+            self._record_error()
             logger.error(f"Error processing request: {e}")
             return KiroResponse(
-                data={"error": str(e), "platform": "cloudrun"},
+                data={"error": str(e), "platform": self.platform},
                 status_code=500,
-                headers={"X-Platform": "cloudrun"},
-                timestamp=datetime.utcnow().isoformat(),
+                headers=self._headers,
+                timestamp=datetime.now(timezone.utc).isoformat(),
             )
 
     def health_check(self) -> Dict[str, Any]:
         """Cloud Run health check"""
         return {
             "status": "healthy",
-            "platform": "cloudrun",
-            "timestamp": datetime.utcnow().isoformat(),
+            "platform": self.platform,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "uptime": self._get_uptime(),
             "request_count": self.request_count,
             "error_count": self.error_count,
@@ -160,17 +240,13 @@ class CloudRunKiroAgent(KiroAgentInterface):
 
     def get_metrics(self) -> KiroMetrics:
         """Get Cloud Run specific metrics"""
-        avg_response_time = (
-            sum(self.response_times) / len(self.response_times)
-            if self.response_times
-            else 0.0
-        )
-
         return KiroMetrics(
-            platform="cloudrun",
+            platform=self.platform,
+            instance_id=self.instance_id,
+            timestamp=datetime.now(timezone.utc).isoformat(),
             request_count=self.request_count,
             error_count=self.error_count,
-            avg_response_time=avg_response_time,
+            avg_response_time=self._avg_response_time(),
             memory_usage=self._get_memory_usage(),
             cpu_usage=self._get_cpu_usage(),
         )
@@ -183,8 +259,7 @@ class CloudRunKiroAgent(KiroAgentInterface):
     def _check_redis(self) -> str:
         """Check Redis connection for Beast Mode"""
         # Optional - only if Beast Mode is enabled
-        beast_mode_enabled = os.getenv("BEAST_MODE_ENABLED", "false").lower() == "true"
-        if not beast_mode_enabled:
+        if not self._beast_mode:
             return "disabled"
 
         try:
@@ -200,30 +275,68 @@ class CloudRunKiroAgent(KiroAgentInterface):
 
     def _get_memory_usage(self) -> float:
         """Get current memory usage in MB"""
-        try:
-            import psutil
-
-            process = psutil.Process()
-            return process.memory_info().rss / 1024 / 1024  # Convert to MB
-        except ImportError:
+        if self._proc is None:
             return 0.0
+        return self._proc.memory_info().rss / 1024 / 1024  # Convert to MB
 
     def _get_cpu_usage(self) -> float:
-        """Get current CPU usage percentage"""
-        try:
-            import psutil
-
-            return psutil.cpu_percent(interval=0.1)
-        except ImportError:
+        """Get CPU usage percentage since the previous call (non-blocking)"""
+        if psutil is None:
             return 0.0
-
-    def run(self, host: str = "0.0.0.0", port: int = None):
-        """Run the Cloud Run agent"""
+        return psutil.cpu_percent(interval=None)
+
+    @classmethod
+    def create_app(cls) -> FastAPI:
+        """App factory for Uvicorn workers - each worker builds its own agent"""
+        return cls().app
+
+    def run(
+        self,
+        host: str = "0.0.0.0",
+        port: int = None,
+        workers: Optional[int] = None,
+        app: Optional[str] = None,
+    ):
+        """Run the Cloud Run agent
+
+        ``workers`` defaults to the ``WORKERS`` env var, then 1. Running more
+        than one worker needs ``app``, an import string naming an app factory
+        (e.g. ``"beast_ai_dev_agent.cloudrun.agent:create_app"``): each worker
+        process builds its own agent from it, so this instance and any routes
+        added to ``self.app`` are not served, and metrics are per worker.
+        Without ``app``, a single worker serves this instance.
+        """
         if port is None:
             port = self.port
+        if workers is None:
+            workers = int(os.getenv("WORKERS", "1"))
 
-        logger.info(f"Starting Cloud Run Kiro Agent on {host}:{port}")
-        uvicorn.run(self.app, host=host, port=port, log_level="info")
+        # Application entry point - configure logging here, not at import time
+        logging.basicConfig(level=logging.INFO)
+
+        if workers > 1 and app is None:
+            logger.warning(
+                "Multiple workers need an app factory import string; running a single worker"
+            )
+            workers = 1
+
+        target: Union[str, FastAPI] = self.app
+        if workers > 1 and app is not None:
+            target = app
+
+        logger.info(
+            f"Starting {self.title} on {host}:{port} (loop={_UVICORN_LOOP}, workers={workers})"
+        )
+        uvicorn.run(
+            target,
+            host=host,
+            port=port,
+            log_level="info",
+            loop=_UVICORN_LOOP,
+            http=_UVICORN_HTTP,
+            workers=workers,
+            factory=workers > 1,
+        )
 
 
 # Factory integration
@@ -231,3 +344,7 @@ def create_cloudrun_agent() -> CloudRunKiroAgent:
     """Factory function for creating Cloud Run agents"""
     return CloudRunKiroAgent()
 
+
+def create_app() -> FastAPI:
+    """ASGI app factory, e.g. ``uvicorn beast_ai_dev_agent.cloudrun.agent:create_app --factory``"""
+    return CloudRunKiroAgent.create_app()
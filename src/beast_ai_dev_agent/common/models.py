@@ -5,40 +5,58 @@ Ensures stateless design and platform compatibility.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Callable, Optional, List, Mapping, Tuple, cast
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from importlib import import_module
+from os import getenv, urandom
+from types import MappingProxyType
+import functools
 import json
 import logging
+import threading
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Kubernetes namespace the agents are deployed into
+KIRO_NAMESPACE = "kiro-agents"
 
-@dataclass
+# Placeholder analysis result. Values are immutable, so a shallow copy per
+# request is enough to keep callers from corrupting the shared template.
+_ANALYSIS_TEMPLATE: Mapping[str, Any] = MappingProxyType(
+    {
+        "status": "analyzed",
+        "confidence": 0.95,
+        "categories": ("example_category",),
+        "insights": ("Example insight from analysis",),
+    }
+)
+
+
+@dataclass(slots=True, frozen=True)
 class KiroRequest:
     """Common request structure for all platforms"""
 
     data: Dict[str, Any]
-    headers: Dict[str, str]
+    headers: Mapping[str, str]
     method: str
     path: str
-    query_params: Dict[str, str]
+    query_params: Mapping[str, str]
     timestamp: str
+    body_size: Optional[int] = None  # raw body length in bytes, if known
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KiroResponse:
     """Common response structure for all platforms"""
 
     status_code: int
     data: Dict[str, Any]
-    headers: Dict[str, str]
+    headers: Mapping[str, str]
     timestamp: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KiroMetrics:
     """Common metrics structure"""
 
@@ -55,13 +73,43 @@ class KiroMetrics:
 class KiroAgentInterface(ABC):
     """Common interface for Kiro agents across platforms"""
 
+    # Platform-specific capabilities/constraints - override on subclasses
+    CAPABILITIES: Tuple[str, ...] = ("basic_http",)
+    CONSTRAINTS: Tuple[str, ...] = ("basic_constraints",)
+
     def __init__(self, platform: str):
         self.platform = platform
+        # Kubernetes sets HOSTNAME to the pod name; elsewhere (e.g. Cloud Run,
+        # where K_REVISION is shared by every instance) use a random per-process id
+        self.instance_id = getenv("HOSTNAME") or f"instance_{urandom(4).hex()}"
         self.request_count = 0
         self.error_count = 0
-        self.response_times = []
+        self._rt_sum = 0.0
+        self._rt_n = 0
+        self._metrics_lock = threading.Lock()
         self.logger = logging.getLogger(f"{__name__}.{platform}")
 
+    def _record_request(self) -> None:
+        """Count an incoming request"""
+        with self._metrics_lock:
+            self.request_count += 1
+
+    def _record_error(self) -> None:
+        """Count a failed request"""
+        with self._metrics_lock:
+            self.error_count += 1
+
+    def _record_response_time(self, response_time: float) -> None:
+        """Add a response time to the running aggregate"""
+        with self._metrics_lock:
+            self._rt_sum += response_time
+            self._rt_n += 1
+
+    def _avg_response_time(self) -> float:
+        """Average response time across all recorded requests"""
+        with self._metrics_lock:
+            return self._rt_sum / self._rt_n if self._rt_n else 0.0
+
     @abstractmethod
     def process_request(self, request: KiroRequest) -> KiroResponse:
         """Process a Kiro agent request - must be implemented by platform"""
@@ -77,22 +125,28 @@ class KiroAgentInterface(ABC):
         """Get agent metrics - platform specific"""
         pass
 
-    def analyze_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Core analysis logic - shared across platforms"""
-        try:
-            self.logger.info(f"Processing analysis request on {self.platform}")
+    def analyze_data(self, data: Dict[str, Any], data_size: Optional[int] = None) -> Dict[str, Any]:
+        """Core analysis logic - shared across platforms
 
+        ``data_size`` is the wire size of the request body in bytes, or None
+        when the caller does not know it. ``top_level_keys`` is the length of an
+        object/array payload, or None for JSON scalars.
+        """
+        try:
             # Core Kiro agent analysis logic
             result = {
                 "analysis_id": self._generate_analysis_id(),
                 "platform": self.platform,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 "input_data": data,
                 "analysis_result": self._perform_analysis(data),
-                "metadata": {"processing_time": self._get_processing_time(), "data_size": len(str(data))},
+                "metadata": {
+                    "processing_time": self._get_processing_time(),
+                    "data_size": data_size,
+                    "top_level_keys": len(data) if isinstance(data, (dict, list)) else None,
+                },
             }
 
-            self.logger.info(f"Analysis completed successfully on {self.platform}")
             return result
 
         except Exception as e:
@@ -101,15 +155,13 @@ class KiroAgentInterface(ABC):
 
     def _generate_analysis_id(self) -> str:
         """Generate unique analysis ID"""
-        import uuid
-
-        return f"kiro_{self.platform}_{uuid.uuid4().hex[:8]}"
+        return f"kiro_{self.platform}_{urandom(4).hex()}"
 
     def _perform_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Perform the actual analysis - implement your logic here"""
         # This is where you implement your specific Kiro agent analysis
-        # For now, returning a placeholder
-        return {"status": "analyzed", "confidence": 0.95, "categories": ["example_category"], "insights": ["Example insight from analysis"]}
+        # For now, returning a copy of the placeholder template
+        return dict(_ANALYSIS_TEMPLATE)
 
     def _get_processing_time(self) -> float:
         """Get processing time in seconds"""
@@ -136,47 +188,59 @@ class KiroAgentInterface(ABC):
 
     def create_error_response(self, error_message: str, status_code: int = 500) -> KiroResponse:
         """Create standardized error response"""
-        self.error_count += 1
+        self._record_error()
 
         return KiroResponse(
             status_code=status_code,
-            data={"status": "error", "message": error_message, "platform": self.platform, "timestamp": datetime.utcnow().isoformat()},
+            data={"status": "error", "message": error_message, "platform": self.platform, "timestamp": datetime.now(timezone.utc).isoformat()},
             headers={"Content-Type": "application/json"},
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=datetime.now(timezone.utc).isoformat(),
         )
 
     def create_success_response(self, data: Dict[str, Any], status_code: int = 200) -> KiroResponse:
         """Create standardized success response"""
-        self.request_count += 1
+        self._record_request()
 
         return KiroResponse(
             status_code=status_code,
-            data={"status": "success", "platform": self.platform, "timestamp": datetime.utcnow().isoformat(), "result": data},
+            data={"status": "success", "platform": self.platform, "timestamp": datetime.now(timezone.utc).isoformat(), "result": data},
             headers={"Content-Type": "application/json"},
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=datetime.now(timezone.utc).isoformat(),
         )
 
     def get_platform_info(self) -> Dict[str, Any]:
         """Get platform-specific information"""
         return {"platform": self.platform, "version": "1.0.0", "capabilities": self._get_platform_capabilities(), "constraints": self._get_platform_constraints()}
 
-    def _get_platform_capabilities(self) -> List[str]:
+    def _get_platform_capabilities(self) -> Tuple[str, ...]:
         """Get platform-specific capabilities"""
-        if self.platform == "gke":
-            return ["persistent_volumes", "stateful_sets", "node_affinity", "custom_networking", "advanced_scaling"]
-        elif self.platform == "cloudrun":
-            return ["auto_scaling", "pay_per_use", "serverless", "http_triggers", "event_triggers"]
-        else:
-            return ["basic_http"]
-
-    def _get_platform_constraints(self) -> List[str]:
+        return self.CAPABILITIES
+
+    def _get_platform_constraints(self) -> Tuple[str, ...]:
         """Get platform-specific constraints"""
-        if self.platform == "gke":
-            return ["stateless_only", "no_persistent_volumes", "no_stateful_sets", "no_node_affinity"]
-        elif self.platform == "cloudrun":
-            return ["15_minute_timeout", "http_only", "stateless_only", "ephemeral_storage"]
-        else:
-            return ["basic_constraints"]
+        return self.CONSTRAINTS
+
+
+@functools.cache
+def _load_agent_class(module: str, name: str) -> Callable[[], KiroAgentInterface]:
+    """Import a platform agent class once and cache it"""
+    return cast(Callable[[], KiroAgentInterface], getattr(import_module(module, __package__), name))
+
+
+def _lazy_agent(module: str, name: str) -> Callable[[], KiroAgentInterface]:
+    """Build a zero-arg agent factory that imports its class on first call"""
+
+    def factory() -> KiroAgentInterface:
+        return _load_agent_class(module, name)()
+
+    return factory
+
+
+# Platform name -> agent factory
+_AGENT_FACTORIES: Dict[str, Callable[[], KiroAgentInterface]] = {
+    "gke": _lazy_agent("..gke.agent", "GKEKiroAgent"),
+    "cloudrun": _lazy_agent("..cloudrun.agent", "CloudRunKiroAgent"),
+}
 
 
 class KiroAgentFactory:
@@ -185,32 +249,27 @@ class KiroAgentFactory:
     @staticmethod
     def create_agent(platform: str) -> KiroAgentInterface:
         """Create a platform-specific Kiro agent"""
-        if platform == "gke":
-            from ..gke.agent import GKEKiroAgent
-
-            return GKEKiroAgent()
-        elif platform == "cloudrun":
-            from ..cloudrun.agent import CloudRunKiroAgent
-
-            return CloudRunKiroAgent()
-        else:
-            raise ValueError(f"Unknown platform: {platform}")
+        try:
+            factory = _AGENT_FACTORIES[platform]
+        except KeyError:
+            raise ValueError(f"Unknown platform: {platform}") from None
+        return factory()
 
     @staticmethod
     def get_available_platforms() -> List[str]:
         """Get list of available platforms"""
-        return ["gke", "cloudrun"]
+        return list(_AGENT_FACTORIES)
 
     @staticmethod
     def validate_platform(platform: str) -> bool:
         """Validate if platform is supported"""
-        return platform in KiroAgentFactory.get_available_platforms()
+        return platform in _AGENT_FACTORIES
 
 
 # Utility functions for common operations
 def create_kiro_request_from_flask(request) -> KiroRequest:
     """Create KiroRequest from Flask request object"""
-    return KiroRequest(data=request.get_json() or {}, headers=dict(request.headers), method=request.method, path=request.path, query_params=dict(request.args), timestamp=datetime.utcnow().isoformat())
+    return KiroRequest(data=request.get_json() or {}, headers=dict(request.headers), method=request.method, path=request.path, query_params=dict(request.args), timestamp=datetime.now(timezone.utc).isoformat(), body_size=request.content_length)
 
 
 def create_flask_response_from_kiro(kiro_response: KiroResponse):
@@ -228,21 +287,39 @@ def log_request(platform: str, request: KiroRequest, response: KiroResponse):
 def validate_stateless_constraints(platform: str) -> bool:
     """Validate that platform meets stateless constraints"""
     if platform == "gke":
-        # Check for forbidden resources
-        import subprocess
-
+        # Check for forbidden resources via the in-process Kubernetes client
         try:
-            # Check for PersistentVolumeClaims
-            result = subprocess.run(["kubectl", "get", "pvc", "-n", "kiro-agents"], capture_output=True, text=True)
-            if result.returncode == 0 and result.stdout.strip():
-                logger.error("❌ FORBIDDEN: PersistentVolumeClaims found")
-                return False
-
-            # Check for StatefulSets
-            result = subprocess.run(["kubectl", "get", "statefulset", "-n", "kiro-agents"], capture_output=True, text=True)
-            if result.returncode == 0 and result.stdout.strip():
-                logger.error("❌ FORBIDDEN: StatefulSets found")
-                return False
+            from concurrent.futures import ThreadPoolExecutor
+
+            from kubernetes import client, config
+            from kubernetes.config import ConfigException
+
+            try:
+                config.load_incluster_config()
+            except ConfigException:
+                config.load_kube_config()
+
+            core_v1 = client.CoreV1Api()
+            apps_v1 = client.AppsV1Api()
+
+            # Issue both list calls concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                pvcs = executor.submit(
+                    core_v1.list_namespaced_persistent_volume_claim, KIRO_NAMESPACE
+                )
+                stateful_sets = executor.submit(
+                    apps_v1.list_namespaced_stateful_set, KIRO_NAMESPACE
+                )
+
+                # Check for PersistentVolumeClaims
+                if pvcs.result().items:
+                    logger.error("❌ FORBIDDEN: PersistentVolumeClaims found")
+                    return False
+
+                # Check for StatefulSets
+                if stateful_sets.result().items:
+                    logger.error("❌ FORBIDDEN: StatefulSets found")
+                    return False
 
             logger.info("✅ GKE stateless constraints validated")
             return True
@@ -6,7 +6,6 @@ Platform-specific implementation for Google Kubernetes Engine
 import logging
 from ..cloudrun.agent import CloudRunKiroAgent
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -21,9 +20,17 @@ class GKEKiroAgent(CloudRunKiroAgent):
     - Horizontal pod autoscaling support
     """
 
+    CAPABILITIES = (
+        "persistent_volumes",
+        "stateful_sets",
+        "node_affinity",
+        "custom_networking",
+        "advanced_scaling",
+    )
+    CONSTRAINTS = ("stateless_only", "no_persistent_volumes", "no_stateful_sets", "no_node_affinity")
+
     def __init__(self):
-        super().__init__()
-        self.platform = "gke"
+        super().__init__(platform="gke", title="GKE Kiro Agent")
         logger.info("GKEKiroAgent initialized with Kubernetes awareness")
 
     # Additional GKE-specific methods can be added here